@@ -4,7 +4,7 @@ import json
 from urllib.request import urlopen
 
 url = 'https://osdr.nasa.gov/osdr/data/osd/files/576'
-with urlopen(url) as response:
+with urlopen(url, timeout=30) as response:
     data = yaml.safe_load(response.read())
     df = pd.DataFrame(data['studies']['OSD-576']['study_files'])
     print("Columns:", df.columns.tolist())
@@ -5,7 +5,7 @@ import zipfile
 import requests
 import click
 
-from dp_tools.glds_api.commons import find_matching_filenames, retrieve_file_url
+from dp_tools.glds_api.commons import find_matching_filenames, retrieve_file_url, REQUEST_TIMEOUT
 
 @click.command()
 @click.option("--osd-id", help='OSD Accession ID. e.g. "OSD-194"', required=True)
@@ -28,7 +28,7 @@ def main(osd_id, output_dir):
 
     def download_file(url, local_filename):
         print(f"Saving file: {local_filename} from {url}")
-        with requests.get(url, stream=True) as r:
+        with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as r:
             r.raise_for_status()
             with open(local_filename, "wb") as f:
                 for chunk in r.iter_content(chunk_size=8192):
@@ -6,14 +6,25 @@ import itertools
 from loguru import logger as log
 import math
 from pathlib import Path
-from statistics import mean
 import string
 import subprocess
-from typing import Callable, Dict, Union
+import zlib
+from typing import Callable, Dict, Optional, Union
 from importlib.metadata import files
 
 import pandas as pd
 
+try:  # ISA-L backed gzip decompression is considerably faster when installed
+    from isal import igzip as gzip_reader
+    from isal.isal_zlib import error as gzip_reader_error
+except ImportError:
+    gzip_reader = gzip
+    gzip_reader_error = zlib.error
+
+# errors raised while decompressing a corrupt or truncated gzip stream with either reader
+# ISA-L reports corrupt deflate data with its own error class, gzip_reader_error, unrelated to zlib.error
+GZIP_DECOMPRESSION_ERRORS = (EOFError, gzip.BadGzipFile, zlib.error)
+
 from dp_tools.core.entity_model import Dataset, Sample, multiqc_run_to_dataframes
 
 from dp_tools.core.check_model import FlagCode, FlagEntry, FlagEntryWithOutliers
@@ -142,6 +153,24 @@ def check_file_exists(file: Path) -> FlagEntry:
     return {"code": code, "message": message}
 
 
+# gzip files already decompressed to the end of the stream (and so CRC verified) by check_fastqgz_file_contents
+# keyed by resolved path, size and modification time so a changed file is always checked again
+# insertion ordered so the oldest entries are dropped once the limit is reached
+_GZIP_STREAMS_VERIFIED: dict[tuple[str, int, int], None] = dict()
+_GZIP_STREAMS_VERIFIED_LIMIT = 100_000
+
+
+def _gzip_stream_key(file: Path) -> tuple[str, int, int]:
+    stat = Path(file).stat()
+    return (str(Path(file).resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def _record_gzip_stream_verified(key: tuple[str, int, int]) -> None:
+    while len(_GZIP_STREAMS_VERIFIED) >= _GZIP_STREAMS_VERIFIED_LIMIT:
+        del _GZIP_STREAMS_VERIFIED[next(iter(_GZIP_STREAMS_VERIFIED))]
+    _GZIP_STREAMS_VERIFIED[key] = None
+
+
 def check_fastqgz_file_contents(file: Path, count_lines_to_check: int) -> FlagEntry:
     """Check fastqgz by:
     1. Decompressing as a stream of lines.
@@ -161,25 +190,59 @@ def check_fastqgz_file_contents(file: Path, count_lines_to_check: int) -> FlagEn
     # truncated files raise EOFError
     # catch this as HALT3
     try:
-        with gzip.open(file, "rb") as f:
-            for i, byte_line in enumerate(f):
-                # checks if lines counted equals the limit input
-                if i + 1 == count_lines_to_check:
-                    log.debug(
-                        f"Reached {count_lines_to_check} lines, ending line check"
-                    )
+        # scan 1 MiB decompressed chunks as bytes, only header line indices are visited
+        # the line limit is preserved: line N (1-based) stops the check, so N-1 lines are checked
+        line_limit = count_lines_to_check - 1 if count_lines_to_check > 0 else None
+        lines_seen = 0
+        # only the first byte of the incomplete line at the end of a chunk is kept, that is all the header test needs
+        # carrying the whole unfinished line would copy it again on every read of a long newline free run
+        remainder_first_byte = b""
+        reached_eof = False
+        # taken before reading so a file replaced or appended to during decompression is never recorded as verified
+        stream_key = _gzip_stream_key(file)
+        with gzip_reader.open(file, "rb") as f:
+            while line_limit is None or lines_seen < line_limit:
+                chunk = f.read(1024 * 1024)
+                if chunk:
+                    lines = chunk.split(b"\n")
+                    # the first element completes the line started in a previous chunk, if any
+                    lines[0] = remainder_first_byte or lines[0]
+                    # last element is an incomplete line, continued by the next chunk
+                    remainder_first_byte = lines.pop()[:1]
+                else:
+                    # a final line without a trailing newline is still a line
+                    lines = [remainder_first_byte] if remainder_first_byte else []
+                    remainder_first_byte = b""
+                    reached_eof = True
+                if line_limit is not None:
+                    lines = lines[: line_limit - lines_seen]
+
+                # a chunk inside a single long line yields no complete lines, reading simply continues
+                if lines:
+                    # every fourth line should be an identifier
+                    first_header = -lines_seen % 4
+                    headers = lines[first_header::4]
+                    if not all(header.startswith(b"@") for header in headers):
+                        lines_with_issues.extend(
+                            lines_seen + first_header + 4 * j + 1
+                            for j, header in enumerate(headers)
+                            if not header.startswith(b"@")
+                        )
+
+                    # update every 2,000,000 reads
+                    if (lines_seen + len(lines)) // 2_000_000 > lines_seen // 2_000_000:
+                        log.debug(f"Checked {lines_seen + len(lines)} lines for {file}")
+                    lines_seen += len(lines)
+
+                if reached_eof:
                     break
 
-                line = byte_line.decode()
-                # every fourth line should be an identifier
-                expected_identifier_line = i % 4 == 0
-                # check if line is actually an identifier line
-                if expected_identifier_line and line[0] != "@":
-                    lines_with_issues.append(i + 1)
-                # update every 2,000,000 reads
-                if i % 2_000_000 == 0:
-                    log.debug(f"Checked {i} lines for {file}")
-                    pass
+            if line_limit is not None and lines_seen == line_limit:
+                log.debug(f"Reached {count_lines_to_check} lines, ending line check")
+
+        if reached_eof and _gzip_stream_key(file) == stream_key:
+            # every member trailer has been verified, so check_gzip_file_integrity need not decompress again
+            _record_gzip_stream_verified(stream_key)
 
         if not len(lines_with_issues) == 0:
             code = FlagCode.HALT
@@ -189,7 +252,7 @@ def check_fastqgz_file_contents(file: Path, count_lines_to_check: int) -> FlagEn
         else:
             code = FlagCode.GREEN
             message = f"First {count_lines_to_check} lines checked found no issues.  This means headers lines were identifiable and no decompression errors occured."
-    except (EOFError, gzip.BadGzipFile):
+    except GZIP_DECOMPRESSION_ERRORS + (gzip_reader_error,):
         code = FlagCode.HALT
         message = (
             f"Error during decompression, likely a compression or truncation issue."
@@ -197,19 +260,41 @@ def check_fastqgz_file_contents(file: Path, count_lines_to_check: int) -> FlagEn
 
     return {"code": code, "message": message}
 
-def check_gzip_file_integrity(file: Path, gzip_bin: Path = Path("gzip")) -> FlagEntry:
-    """ Check gzip file integrity using 'gzip -t' as per https://www.gnu.org/software/gzip/manual/gzip.html """
-    output = subprocess.run(
-        [str(gzip_bin), "-t", str(file)], capture_output=True
-    )
-    stdout_string = output.stdout.decode()
-    if stdout_string == "":
+def check_gzip_file_integrity(file: Path, gzip_bin: Optional[Path] = None) -> FlagEntry:
+    """ Check gzip file integrity, equivalent to 'gzip -t' as per https://www.gnu.org/software/gzip/manual/gzip.html
+
+    By default the file is decompressed in process (using ISA-L when installed), in which case the
+    CRC32 and length in each gzip member trailer are verified on reaching the end of the stream.
+    This avoids spawning a process per file. If 'gzip_bin' is supplied, that binary is run with '-t' instead.
+    """
+    error_output: Optional[str] = None
+    if gzip_bin is not None:
+        output = subprocess.run(
+            [str(gzip_bin), "-t", str(file)], capture_output=True
+        )
+        # 'gzip -t' is silent on stdout, failures are signalled by exit status and described on stderr
+        if output.returncode != 0:
+            error_output = output.stderr.decode()
+    else:
+        try:
+            stream_key = _gzip_stream_key(file)
+            # both readers treat an empty file as an empty stream, 'gzip -t' rejects it as it holds no gzip member
+            if stream_key[1] == 0:
+                error_output = "unexpected end of file, file is empty and contains no gzip member"
+            # skipped if already decompressed to the end of the stream by check_fastqgz_file_contents
+            elif stream_key not in _GZIP_STREAMS_VERIFIED:
+                with gzip_reader.open(file, "rb") as f:
+                    while f.read(1024 * 1024):
+                        pass
+        except (OSError, gzip_reader_error) + GZIP_DECOMPRESSION_ERRORS as e:
+            error_output = f"{type(e).__name__}: {e}"
+    if error_output is None:
         code = FlagCode.GREEN
         message = f"Gzip integrity test raised no issues"
     else:
         code = FlagCode.HALT
         message = (
-            f"Gzip integrity test failed on this file with output: {stdout_string}"
+            f"Gzip integrity test failed on this file with output: {error_output}"
         )
     return {"code": code, "message": message}    
 
@@ -310,37 +395,47 @@ def check_for_outliers(
     if mqc_keys == ["_ALL"]:
         mqc_keys = df.columns
 
-    for mqc_key in mqc_keys:
-        for threshold in thresholds:
-            if threshold["middle_fcn"] == "mean":
-                middle = df[mqc_key].mean()
-            elif threshold["middle_fcn"] == "median":
-                middle = df[mqc_key].median()
-            else:
-                raise ValueError(
-                    f"Cannot compute middle from supplied middle_fcn name: {threshold['middle_fcn']}. Must supply either 'median' or 'mean'"
-                )
-
-            # bail if standard deviation == 0
-            # e.g. if all values are identical (and thus has no outliers)
-            if df[mqc_key].std() == 0:
-                continue
-
-            # compute difference
-            df_diffs = df[mqc_key] - middle
-
-            # compute as number of standard deviations
-            df_diffs_in_std = df_diffs / df[mqc_key].std()
+    # spread, middles and deviations are computed for all keys at once as whole frame operations
+    values = df[mqc_keys]
+    stds = values.std()
+    diffs_in_std_by_middle_fcn: dict[str, pd.DataFrame] = dict()
+    for threshold in thresholds:
+        middle_fcn = threshold["middle_fcn"]
+        if middle_fcn in diffs_in_std_by_middle_fcn:
+            continue
+        if middle_fcn == "mean":
+            middles = values.mean()
+        elif middle_fcn == "median":
+            middles = values.median()
+        else:
+            raise ValueError(
+                f"Cannot compute middle from supplied middle_fcn name: {middle_fcn}. Must supply either 'median' or 'mean'"
+            )
+        # compute as number of standard deviations
+        diffs_in_std_by_middle_fcn[middle_fcn] = (values - middles) / stds
+
+    # one boolean frame per threshold marks every outlier across all keys
+    outlier_masks = [
+        diffs_in_std_by_middle_fcn[threshold["middle_fcn"]].abs()
+        > threshold["stdev_threshold"]
+        for threshold in thresholds
+    ]
 
+    for mqc_key in mqc_keys:
+        # bail if standard deviation == 0
+        # e.g. if all values are identical (and thus has no outliers)
+        if stds[mqc_key] == 0:
+            continue
+        for threshold, outlier_mask in zip(thresholds, outlier_masks):
+            df_diffs_in_std = diffs_in_std_by_middle_fcn[threshold["middle_fcn"]]
+            df_outliers = df_diffs_in_std.loc[outlier_mask[mqc_key], mqc_key]
             # add to outlier tracker if over the threshold
-            for key, value in df_diffs_in_std.items():
-                # if an outlier
-                if abs(value) > threshold["stdev_threshold"]:
-                    # track it
-                    outliers[key][mqc_module][mqc_key] = value
-                    # elevate code if current code is lower severity
-                    if code < FlagCode[threshold["code"]]:
-                        code = FlagCode[threshold["code"]]
+            for key, value in df_outliers.items():
+                # track it
+                outliers[key][mqc_module][mqc_key] = value
+            # elevate code if current code is lower severity
+            if not df_outliers.empty and code < FlagCode[threshold["code"]]:
+                code = FlagCode[threshold["code"]]
 
     # convert defaultdict to regular for all reporting
     outliers = default_to_regular(outliers)
@@ -912,7 +1007,7 @@ def check_dge_table_group_columns_exist(
         "".join(comb)
         for comb in itertools.product(GROUP_PREFIXES, expected_groups.values())
     }
-    df_dge_columns = set(pd.read_csv(dge_table).columns)
+    df_dge_columns = set(pd.read_csv(dge_table, nrows=0).columns)
     missing_cols = expected_columns - df_dge_columns
 
     # check logic
@@ -1001,7 +1096,7 @@ def check_dge_table_comparison_statistical_columns_exist(
         "".join(comb)
         for comb in itertools.product(COMPARISON_PREFIXES, expected_comparisons)
     }
-    df_dge_columns = set(pd.read_csv(dge_table).columns)
+    df_dge_columns = set(pd.read_csv(dge_table, nrows=0).columns)
     missing_cols = expected_columns - df_dge_columns
 
     # check logic
@@ -1104,7 +1199,7 @@ def check_dge_table_fixed_statistical_columns_exist(dge_table: Path, **_) -> Fla
         "LRT.p.value": {"nonNull": False, "nonNegative": True},
     }
     expected_columns = set(fixed_stats_columns)
-    df_dge_columns = set(pd.read_csv(dge_table).columns)
+    df_dge_columns = set(pd.read_csv(dge_table, nrows=0).columns)
     missing_cols = expected_columns - df_dge_columns
 
     # check logic
@@ -1181,11 +1276,12 @@ def check_dge_table_log2fc_within_reason(
         abs_percent_difference = abs(
             ((computed_log2fc - df_dge[query_column]) / df_dge[query_column]) * 100
         )
+        # vectorized mean of the boolean mask, statistics.mean would sum every gene as a Python object
         percent_within_tolerance = (
-            mean(
+            (
                 abs_percent_difference
                 < LOG2FC_CROSS_METHOD_PERCENT_DIFFERENCE_THRESHOLD
-            )
+            ).mean()
             * 100
         )
         # flag if not enough within tolerance
@@ -1279,7 +1375,7 @@ def check_viz_table_columns_exist(dge_table: Path, runsheet: Path, **_) -> FlagE
     expected_columns = set(
         itertools.chain(*[c1 for c1, _ in viz_pairwise_columns_prefixes])
     )
-    df_dge_columns = set(pd.read_csv(dge_table).columns)
+    df_dge_columns = set(pd.read_csv(dge_table, nrows=0).columns)
     missing_cols = expected_columns - df_dge_columns
 
     # check logic
@@ -1517,7 +1613,9 @@ def check_sample_in_multiqc_report(
     """
     # Load multiQC sources table and retrieve set of samples
     [sources_table] = multiqc_report_path.glob("**/multiqc_sources.txt")
-    multiQC_samples = list(pd.read_csv(sources_table, sep="\t")["Sample Name"])
+    multiQC_samples = list(
+        pd.read_csv(sources_table, sep="\t", usecols=["Sample Name"])["Sample Name"]
+    )
 
     # Transform multiQC samples using name_reformat_func
     reformatted_multiQC_samples = [name_reformat_func(s) for s in multiQC_samples]
@@ -2,6 +2,7 @@ from pathlib import Path
 import re
 from typing import Union
 import yaml
+from dp_tools.config.interface import YAML_LOADER
 from loguru import logger as log
 
 from dp_tools.core.entity_model import Dataset
@@ -161,7 +162,7 @@ def validate_bulkRNASeq(
 
     if config_path is not None:
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
     else:
         config = CONFIG
 
@@ -180,7 +180,9 @@ class BulkRNASeqMetadataComponent(TemplateComponent):
     @functools.cached_property
     def organism(self):
         # retrieve from runsheet
-        [organism] = pd.read_csv(self.runsheet.path)["organism"].unique()
+        [organism] = pd.read_csv(self.runsheet.path, usecols=["organism"])[
+            "organism"
+        ].unique()
         return organism
 
     @staticmethod
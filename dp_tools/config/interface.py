@@ -13,6 +13,9 @@ ConfigVersion = tuple[str, str]
 ConfigSelection = Union[ConfigVersion, Path]
 """ Specifies a configuration file, either prepackaged or by direct local path """
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+""" Same semantics as yaml.safe_load but uses the libyaml C implementation when PyYAML was built with it """
+
 @functools.cache # Allows repeated usage of this function without actually loading from file more than once
 def load_config(config: ConfigSelection) -> dict:
     """Load yaml configuration file. Allows loading from either:
@@ -31,10 +34,10 @@ def load_config(config: ConfigSelection) -> dict:
             [resolved_config_path] = (p for p in files('dp_tools') if p.name == query_config_fn)
             log.info(f"Loading config (relative to package): {resolved_config_path}")
             with open(resolved_config_path.locate(), "r") as f:
-                conf_full = yaml.safe_load(f)
+                conf_full = yaml.load(f, Loader=YAML_LOADER)
         case Path():
             log.info(f"Loading config (direct path): {config}")
-            conf_full = yaml.safe_load(config.open())
+            conf_full = yaml.load(config.open(), Loader=YAML_LOADER)
 
     log.debug(f"Final config loaded: {conf_full}")
 
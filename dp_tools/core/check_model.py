@@ -1,6 +1,7 @@
 import textwrap
 from collections import Counter, defaultdict
 from contextlib import contextmanager
+import functools
 import enum
 
 from typing import Callable, TypedDict, Union, Literal
@@ -679,6 +680,8 @@ class ValidationProtocol:
                 log.debug(f"Adding {check}")
                 check_by_component[check["component"]].append(check)
 
+        # memoized as every ancestor's 'ALL' counter would otherwise recount the same subtree
+        @functools.cache
         def sum_all_children(component: ValidationProtocol._Component) -> int:
             sum = len(check_by_component[component])
             for child in component.children:
@@ -716,8 +719,8 @@ class ValidationProtocol:
                     buffer += "\n" + "\n".join(check_line_print)
 
             for child in component.children:
-                if render_self_and_children(child):
-                    buffer += "\n" + render_self_and_children(child)
+                if child_buffer := render_self_and_children(child):
+                    buffer += "\n" + child_buffer
             return buffer
 
         def format_data_asset_load_report(data_asset_load_report: pd.DataFrame) -> str:
@@ -921,17 +924,19 @@ class ValidationProtocol:
 
         df = pd.DataFrame(df_data).set_index("index")
 
+        # creating derivative colun from code
+        df["code_level"] = df["code"].apply(lambda x: x.value)
+
         # filtering as requested in args
+        # compares integer levels rather than FlagCode members element by element
         if not include_skipped:
-            df = df.loc[df["code"] != FlagCode.SKIPPED]
+            df = df.loc[df["code_level"] != FlagCode.SKIPPED.value]
 
         def default_to_regular(d):
             if isinstance(d, defaultdict):
                 d = {k: default_to_regular(v) for k, v in d.items()}
             return d
 
-        # creating derivative colun from code
-        df["code_level"] = df["code"].apply(lambda x: x.value)
         # resort columns
         df = df[COL_ORDER]
 
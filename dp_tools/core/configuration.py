@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 from typing import Union
@@ -6,6 +7,7 @@ from warnings import warn
 from loguru import logger as log
 
 import yaml
+from dp_tools.config.interface import YAML_LOADER
 
 
 def load_full_config(config: Union[str, Path]) -> dict:
@@ -19,12 +21,13 @@ def load_full_config(config: Union[str, Path]) -> dict:
             "..", "config", f"bulkRNASeq_v{config}.yaml"
         )
         log.info(f"Loading full config (relative to package): {resolved_config_path}")
-        conf_full = yaml.safe_load(
-            pkg_resources.files(__name__).joinpath(resolved_config_path).read_bytes()
+        conf_full = yaml.load(
+            pkg_resources.files(__name__).joinpath(resolved_config_path).read_bytes(),
+            Loader=YAML_LOADER,
         )
     elif isinstance(config, Path):
         log.info(f"Loading config (direct path): {config}")
-        conf_full = yaml.safe_load(config.open())
+        conf_full = yaml.load(config.open(), Loader=YAML_LOADER)
 
     # validate with schema
     # config_schema = Schema()
@@ -34,6 +37,7 @@ def load_full_config(config: Union[str, Path]) -> dict:
     return conf_full
 
 
+@functools.cache # Allows repeated usage of this function without actually loading from file more than once
 def load_config(config: Union[tuple[str, str], Path]) -> dict:
     """Load yaml configuration file. Allows loading from either:
       - A prepackaged configuration file using a tuple of ('config_type','config_version') (e.g. ('bulkRNASeq','Latest'), ('microarray','0'))
@@ -51,12 +55,13 @@ def load_config(config: Union[tuple[str, str], Path]) -> dict:
                 "..", "config", f"{conf_type}_v{conf_version}.yaml"
             )
             log.info(f"Loading config (relative to package): {resolved_config_path}")
-            conf_full = yaml.safe_load(
-                pkg_resources.files(__name__).joinpath(resolved_config_path).read_bytes()
+            conf_full = yaml.load(
+                pkg_resources.files(__name__).joinpath(resolved_config_path).read_bytes(),
+                Loader=YAML_LOADER,
             )
         case Path():
             log.info(f"Loading config (direct path): {config}")
-            conf_full = yaml.safe_load(config.open())
+            conf_full = yaml.load(config.open(), Loader=YAML_LOADER)
         case _:
             raise ValueError(f"Cannot load config from {config}")
 
@@ -1,5 +1,7 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
+import fnmatch
+import os
 from pathlib import Path
 from string import Formatter
 import uuid
@@ -11,19 +13,12 @@ from enum import Enum, auto
 from dp_tools.core.check_model import FlagCode
 
 import pandas as pd
-import multiqc
-from multiqc import report
 import collections
 
-# MULTIQC MONKEY PATCH TO ADDRESS ISSUE: https://github.com/ewels/MultiQC/issues/1643
-multiqc.config.logger.hasHandlers = (
-    lambda: False
-)  # this means the logger never gets purged, but more importantly prevents a log purge based exceptoin
-
-
 from dp_tools.core.utilites.multiqc_tools import (
     format_plots_as_dataframe,
     get_general_stats,
+    import_multiqc,
 )
 
 
@@ -161,10 +156,26 @@ class Dataset:
         config: dict,
         owner: ExperimentalEntity,
         putative: bool,
+        dir_entries: dict[Path, list[str]] = None,
     ) -> DataAsset:
         if "*" in asset.name:
+            # directory listings are shared across calls (e.g. all samples for one asset key)
+            # rather than rescanning the same parent directory for each glob
+            if dir_entries is None:
+                dir_entries = dict()
+            if asset.parent not in dir_entries:
+                try:
+                    with os.scandir(asset.parent) as entries:
+                        dir_entries[asset.parent] = [entry.name for entry in entries]
+                except OSError:
+                    # consistent with Path.glob, a missing directory has no matches
+                    dir_entries[asset.parent] = list()
             try:
-                [asset] = asset.parent.glob(asset.name)
+                [asset] = [
+                    asset.parent / entry_name
+                    for entry_name in dir_entries[asset.parent]
+                    if fnmatch.fnmatchcase(entry_name, asset.name)
+                ]
             except ValueError as exc:
                 raise ValueError(
                     f"Failed to locate data asset using glob pattern: '{asset.name}'"
@@ -246,6 +257,7 @@ class Dataset:
                 owner = "dataset"
 
         # Locate data asset
+        dir_entries: dict[Path, list[str]] = dict()
         match owner:
             case "dataset":
                 unloaded_asset = Path(str(location_template).format(dataset=self.name))
@@ -270,6 +282,7 @@ class Dataset:
                         config=data_asset_config,
                         owner=group,
                         putative=putative,
+                        dir_entries=dir_entries,
                     )
                     self.groups[group.name].data_assets[name] = asset
             case "sample":
@@ -285,6 +298,7 @@ class Dataset:
                         config=data_asset_config,
                         owner=sample,
                         putative=putative,
+                        dir_entries=dir_entries,
                     )
                     self.samples[sample.name].data_assets[name] = asset
 
@@ -316,6 +330,9 @@ class Dataset:
 
 
 def multiqc_run_to_dataframes(paths: list[Path]) -> dict:
+    multiqc = import_multiqc()
+    from multiqc import report
+
     try:
         mqc_ret = multiqc.run(
             *paths# module=[
@@ -1,10 +1,13 @@
 # Functions that deal directly with GLDS ISA Archives
 
+import functools
+import io
 from pathlib import Path
 import tempfile
 import zipfile
 from loguru import logger as log
 
+import numpy as np
 import pandas as pd
 
 from loguru import logger as log
@@ -24,13 +27,60 @@ ISA_INVESTIGATION_HEADERS = {
 }
 
 
-def fetch_isa_files(ISAarchive: Path) -> set[Path]:
+@functools.lru_cache(maxsize=8)
+def _extract_isa_archive(ISAarchive: Path, mtime_ns: int) -> frozenset[Path]:
+    # mtime_ns is only used as part of the cache key, ensuring a modified archive is re-extracted
     temp_dir = tempfile.mkdtemp()
     log.debug(f"Extracting ISA Archive to temp directory: {temp_dir}")
     with zipfile.ZipFile(ISAarchive, "r") as zip_ref:
-        zip_ref.extractall(temp_dir)
+        # extract returns each written path, so the temp directory never needs to be walked and stat'd
+        return frozenset(
+            Path(zip_ref.extract(member, temp_dir))
+            for member in zip_ref.infolist()
+            if not member.is_dir()
+        )
+
+
+def fetch_isa_files(ISAarchive: Path) -> set[Path]:
+    """Extracts the ISA archive to a temporary directory and returns the extracted file paths.
+
+    Extraction is cached by resolved archive path and modification time so repeated calls
+    against an unchanged archive reuse the same extracted files.
+
+    :param ISAarchive: Path to ISA archive zip file
+    :type ISAarchive: Path
+    :return: Paths to all extracted files
+    :rtype: set[Path]
+    """
+    ISAarchive = Path(ISAarchive).resolve()
+    return set(_extract_isa_archive(ISAarchive, ISAarchive.stat().st_mtime_ns))
+
+
+def read_investigation_file(ISAarchive: Path) -> bytes:
+    """Reads the raw investigation file ('i_*') directly from the ISA archive without extracting to disk.
+
+    :param ISAarchive: Path to ISA archive zip file
+    :type ISAarchive: Path
+    :return: Undecoded contents of the investigation file
+    :rtype: bytes
+    """
+    with zipfile.ZipFile(ISAarchive, "r") as zip_ref:
+        [i_file] = (
+            name
+            for name in zip_ref.namelist()
+            if not name.endswith("/") and Path(name).name.startswith("i_")
+        )
+        return zip_ref.read(i_file)
+
 
-    return {f for f in Path(temp_dir).rglob("*") if f.is_file()}
+def _subtable_to_dataframe(table_lines: list[list[str]]) -> pd.DataFrame:
+    # each subtable is transposed in the i_file
+    # ragged lines are padded once so the transpose is a numpy view rather than a pandas copy
+    width = max((len(tokens) for tokens in table_lines), default=0)
+    padded = np.empty((len(table_lines), width), dtype=object)
+    for i, tokens in enumerate(table_lines):
+        padded[i, : len(tokens)] = tokens
+    return pd.DataFrame(padded.T)
 
 
 def isa_investigation_subtables(isaArchive: Path) -> dict[str, pd.DataFrame]:
@@ -40,53 +90,42 @@ def isa_investigation_subtables(isaArchive: Path) -> dict[str, pd.DataFrame]:
     table_lines: list[list] = list()
     key: str = None  # type: ignore
 
-    [i_file] = (
-        f for f in fetch_isa_files(isaArchive) if f.name.startswith("i_")
-    )
+    raw_i_file = read_investigation_file(isaArchive)
     # Default to 'utf-8'
+    # Note: StringIO with newline=None splits lines the same way as reading the file in text mode
+    #   and is iterated lazily rather than materializing a list of lines
     try:
         log.trace("Decoding ISA with 'utf-8")
-        with open(i_file, "r", encoding = "utf-8") as f:
-            lines = f.readlines()
+        lines = io.StringIO(raw_i_file.decode("utf-8"), newline=None)
     # Fallback to "ISO-8859-1" if 'utf-8' fails
     except UnicodeDecodeError:
         log.warning("Failed using 'utf-8'. Decoding ISA with 'ISO-8859-1'")
-        with open(i_file, "r", encoding = "ISO-8859-1") as f:
-            lines = f.readlines()
+        lines = io.StringIO(raw_i_file.decode("ISO-8859-1"), newline=None)
     for line in lines:
         line = line.rstrip()
         # search for header
         if line in ISA_INVESTIGATION_HEADERS:
             if key != None:
-                tables[key] = pd.DataFrame(
-                    table_lines
-                ).T  # each subtable is transposed in the i_file
+                tables[key] = _subtable_to_dataframe(table_lines)
                 table_lines = list()
             key = line  # set next table key
         else:
             tokens = line.split("\t")  # tab separated
             table_lines.append(tokens)
-    tables[key] = pd.DataFrame(
-        table_lines
-    ).T  # each subtable is transposed in the i_file
+    tables[key] = _subtable_to_dataframe(table_lines)
 
     # reformat each table
-    def clean_quotes(string: str) -> str:
-        SINGLE_OR_DOUBLE_QUOTES = "\"'"
-        # don't perform on non-string elements
-        if not isinstance(string, str):
-            return string
-        else:
-            return string.lstrip(SINGLE_OR_DOUBLE_QUOTES).rstrip(
-                SINGLE_OR_DOUBLE_QUOTES
-            )
+    SINGLE_OR_DOUBLE_QUOTES = "\"'"
 
     df: pd.DataFrame
     for key, df in tables.items():
 
         # note: as a ref, no reassign needed
+        # vectorized quote stripping per column, non-string (missing) elements are left as missing
         tables[key] = (
-            df.rename(columns=df.iloc[0]).drop(df.index[0]).map(clean_quotes)
+            df.rename(columns=df.iloc[0])
+            .drop(df.index[0])
+            .apply(lambda column: column.str.strip(SINGLE_OR_DOUBLE_QUOTES))
         )
 
     # ensure all expected subtables present
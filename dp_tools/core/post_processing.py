@@ -25,6 +25,7 @@ from dp_tools.core.files import isa_archive
 
 from schema import Schema
 import yaml
+from dp_tools.config.interface import YAML_LOADER
 import pandas as pd
 
 # constants
@@ -37,14 +38,15 @@ def _load_config(
     config: Union[tuple[str, str], Path], subsection: str = "ISA Meta"
 ) -> dict:
     if isinstance(config, tuple):
-        configuration = yaml.safe_load(
+        configuration = yaml.load(
             pkg_resources.resource_string(
                 __name__,
                 os.path.join("..", "config", f"{config[0]}_v{config[1]}.yaml"),
-            )
+            ),
+            Loader=YAML_LOADER,
         )
     elif isinstance(config, Path):
-        configuration = yaml.safe_load(config.open())
+        configuration = yaml.load(config.open(), Loader=YAML_LOADER)
 
     # filter to relevant subsection
     sub_configuration = configuration[subsection]
@@ -69,11 +71,12 @@ def _load_config(
 
 
 def load_ISA_investigation_config() -> dict:
-    configuration = yaml.safe_load(
+    configuration = yaml.load(
         pkg_resources.resource_string(
             __name__,
             os.path.join("..", "config", f"ISA_investigation.yaml"),
-        )
+        ),
+        Loader=YAML_LOADER,
     )
 
     log.debug("Loaded the ISA investigation config")
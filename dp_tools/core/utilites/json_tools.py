@@ -0,0 +1,26 @@
+""" Functions that parse json """
+import json
+from typing import Any, Union
+
+try:  # orjson is part of the optional 'fast' extra
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """Parse json, using orjson when installed.
+
+    Falls back to the standard library for content orjson rejects but the standard library accepts (e.g. NaN literals).
+
+    :param raw: Json content, e.g. as read from a file or response body
+    :type raw: Union[bytes, str]
+    :return: Parsed json
+    :rtype: Any
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
@@ -1,7 +1,6 @@
 # Enum for assay types
 import ast
 from enum import Enum
-import json
 import pathlib
 from pathlib import Path
 from dataclasses import dataclass
@@ -9,11 +8,16 @@ from typing import Literal
 import numpy as np
 
 import yaml
+from dp_tools.config.interface import YAML_LOADER
 import pandas as pd
 from loguru import logger
 
 from dp_tools.scripts import convert
-from dp_tools.core.utilites import multiqc_tools
+from dp_tools.core.utilites import json_tools, multiqc_tools
+
+def load_json(json_file: Path) -> dict:
+    """Loads a json file, using orjson when installed."""
+    return json_tools.loads(Path(json_file).read_bytes())
 
 
 class AssayType(Enum):
@@ -98,8 +102,7 @@ class MetricsExtractor:
             self, section_name: str, json_file: Path, module: str
         ):
             # Load json data
-            with open(json_file) as file:
-                data = json.load(file)
+            data = load_json(json_file)
 
             # Note: Certain modules like RSeQC don't produce a general stats table
             # So we need to check if it exists before trying to extract it
@@ -317,7 +320,7 @@ class MetricsExtractor:
     def append_manual_yaml_data(self, target_yaml: Path):
         # Start with df_isa and add columns for each key value in yaml
         with open(target_yaml) as file:
-            new_data = yaml.safe_load(file)
+            new_data = yaml.load(file, Loader=YAML_LOADER)
 
         # Add the new data to the existing data as new columns
         for key, value in new_data.items():
@@ -1121,7 +1124,7 @@ class MetricsExtractor:
 
 def generate_extractor_from_yaml_config(config: Path) -> MetricsExtractor:
     with open(config) as file:
-        config_data = yaml.safe_load(file)
+        config_data = yaml.load(file, Loader=YAML_LOADER)
 
     targets: list[MultiQCTargetSection] = list()
 
@@ -1,5 +1,6 @@
 # function for running multiqc and getting data objects back
 from collections import defaultdict
+import functools
 from pathlib import Path
 from types import ModuleType
 from typing import List, TypedDict
@@ -10,9 +11,27 @@ import re
 from loguru import logger as log
 from zipfile import ZipFile
 
-import multiqc
 import pandas as pd
 
+@functools.cache
+def import_multiqc() -> ModuleType:
+    """Imports multiqc on first use rather than at module import.
+
+    multiqc accounts for most of the import time of the data model modules
+    but is only needed when MultiQC reports are actually parsed.
+
+    :return: The multiqc module, with the logger patch below applied
+    :rtype: ModuleType
+    """
+    import multiqc
+
+    # MULTIQC MONKEY PATCH TO ADDRESS ISSUE: https://github.com/ewels/MultiQC/issues/1643
+    multiqc.config.logger.hasHandlers = (
+        lambda: False
+    )  # this means the logger never gets purged, but more importantly prevents a log purge based exceptoin
+    return multiqc
+
+
 # iterable to remove suffixes and add them as subsource descriptors
 SUBSOURCES = [
     "_R1",
@@ -24,6 +43,7 @@ SUBSOURCES = [
 SCRUB_SAMPLES = ["_read_dist", "_infer_expt", "_raw"]
 
 
+@functools.cache  # the same sample names are cleaned again for every plot and general stats table
 def clean_messy_sample(messy_sample: str):
     # if any subsource suffixes found, cleans those from the sample name
     # returns two strings: cleaned_sample_name, suffix
@@ -96,7 +116,7 @@ def get_parsed_data(
         # a workaround for flushing handlers in MQC version 1.11
         # logger = log.getLogger("multiqc")
         # [logger.removeHandler(h) for h in logger.handlers]
-        mqc_ret = multiqc.run(
+        mqc_ret = import_multiqc().run(
             *input_f)  # note: empty list for modules falls back on all modules
         log.info(f"Successfully parsed: {input_f}")
     except SystemExit as e:
@@ -2,21 +2,79 @@
 Python functions the retrieve data from GeneLab. Uses the GeneLab public APIs (https://genelab.nasa.gov/genelabAPIs)
 """
 
+import fnmatch
 import functools
+import re
 from urllib.request import urlopen
 import requests
-import json
 
 from loguru import logger as log
 import yaml
 import pandas as pd
 
+from dp_tools.config.interface import YAML_LOADER
+from dp_tools.core.utilites import json_tools
+
 GENELAB_DATASET_FILES = "https://osdr.nasa.gov/osdr/data/osd/files/{accession_number}"
 """ Template URL to access json of files for a single GLDS accession ID """
 
 FILE_RETRIEVAL_URL_PREFIX = "https://osdr.nasa.gov{suffix}"
 """ Used to retrieve files using remote url suffixes listed in the 'Data Query' API """
 
+GENELAB_SEARCH_URL = "https://osdr.nasa.gov/osdr/data/search?ffield=Data+Source+Type&fvalue=cgene&size=5000"
+""" Search API query listing all GeneLab datasets, used to map GLDS accession IDs to OSD accession IDs """
+
+REQUEST_TIMEOUT = (5, 30)
+""" (connect, read) timeouts in seconds for outbound requests, ensures a hung OSDR endpoint fails fast instead of blocking indefinitely """
+
+def _index_hits_by_identifier(hits: list[dict]) -> dict[str, dict]:
+    """Map each identifier (e.g. 'GLDS-194') listed in a search hit to that hit's '_source'.
+
+    The first hit listing an identifier wins, matching a linear scan over the hits.
+
+    :param hits: The 'hits.hits' list returned by the search API
+    :type hits: list[dict]
+    :return: Dictionary keyed by identifier
+    :rtype: dict[str, dict]
+    """
+    index: dict[str, dict] = {}
+    for hit in hits:
+        source = hit.get("_source", {})
+        for identifier in source.get("Identifiers", "").split():
+            index.setdefault(identifier, source)
+    return index
+
+@functools.cache
+def _get_search_identifier_index() -> dict[str, dict]:
+    """Retrieve the search API listing once and index its hits by identifier.
+
+    A single search response lists every GLDS identifier, so it is cached and shared by all GLDS lookups.
+
+    :return: Dictionary keyed by identifier, e.g. 'GLDS-194', with the hit '_source' as the value
+    :rtype: dict[str, dict]
+    """
+    log.info(f"Querying search API: {GENELAB_SEARCH_URL}")
+    with urlopen(GENELAB_SEARCH_URL, timeout=REQUEST_TIMEOUT[1]) as search_response:
+        search_data = json_tools.loads(search_response.read())
+    return _index_hits_by_identifier(search_data.get("hits", {}).get("hits", []))
+
+def resolve_glds_to_osd(accessions: list[str]) -> dict[str, str]:
+    """Map GLDS accession IDs to their OSD accession IDs using a single search API request.
+
+    Accessions not found in the search results are omitted from the returned mapping.
+
+    :param accessions: GLDS accession IDs, e.g. ['GLDS-194', 'GLDS-570']
+    :type accessions: list[str]
+    :return: Dictionary mapping each found GLDS accession to its OSD accession, e.g. {'GLDS-570': 'OSD-576'}
+    :rtype: dict[str, str]
+    """
+    identifier_index = _get_search_identifier_index()
+    return {
+        accession: identifier_index[accession].get("Accession")
+        for accession in accessions
+        if accession in identifier_index
+    }
+
 @functools.cache
 def get_table_of_files(accession: str) -> pd.DataFrame:
     """Retrieve table of filenames associated with a GLDS or OSD accession ID.
@@ -27,6 +85,7 @@ def get_table_of_files(accession: str) -> pd.DataFrame:
     
     Note: This function is cached to prevent extra api calls. This can desync from the repository 
     in the rare case that the accession is updated in between related calls.
+    The returned dataframe is shared between callers and should be treated as read-only.
 
     :param accession: Accession ID, e.g. 'GLDS-194' or 'OSD-194'
     :type accession: str
@@ -44,8 +103,8 @@ def get_table_of_files(accession: str) -> pd.DataFrame:
         # fetch data
         log.info(f"URL Source: {url}")
         print(url)
-        with urlopen(url) as response:
-            data = yaml.safe_load(response.read())
+        with urlopen(url, timeout=REQUEST_TIMEOUT[1]) as response:
+            data = yaml.load(response.read(), Loader=YAML_LOADER)
             try:
                 df = pd.DataFrame(data['studies'][accession]['study_files'])
             except KeyError:
@@ -55,48 +114,41 @@ def get_table_of_files(accession: str) -> pd.DataFrame:
     # For GLDS accessions, we MUST use the search API to find the OSD mapping
     elif accession.startswith("GLDS-"):
         log.info(f"Searching for OSD mapping for {accession}")
-        search_url = "https://osdr.nasa.gov/osdr/data/search?ffield=Data+Source+Type&fvalue=cgene&size=5000"
-        
         try:
-            log.info(f"Querying search API: {search_url}")
-            with urlopen(search_url) as search_response:
-                search_data = json.loads(search_response.read())
-                
-                # Look for GLDS ID in Identifiers
-                found_mapping = False
-                for hit in search_data.get("hits", {}).get("hits", []):
-                    source = hit.get("_source", {})
-                    identifiers = source.get("Identifiers", "")
-                    
-                    # Check if our GLDS ID is in the identifiers
-                    if accession in identifiers.split():
-                        # Found the mapping
-                        osd_accession = source.get("Accession")  # e.g., "OSD-489"
-                        log.info(f"Found mapping: {accession} → {osd_accession}")
-                        found_mapping = True
-                        
-                        # Now get the files for this OSD
-                        osd_num = osd_accession.split("-")[1]
-                        file_url = GENELAB_DATASET_FILES.format(accession_number=osd_num)
-                        log.info(f"Fetching files from: {file_url}")
-                        
-                        with urlopen(file_url) as file_response:
-                            file_data = yaml.safe_load(file_response.read())
-                            try:
-                                df = pd.DataFrame(file_data['studies'][osd_accession]['study_files'])
-                                return df
-                            except KeyError:
-                                raise ValueError(f"{osd_accession} is not reachable on OSD website after mapping from {accession}")
-                
-                # If we get here, no mapping was found
-                if not found_mapping:
-                    raise ValueError(f"Could not find OSD mapping for {accession} in search results")
-                    
+            osd_accession = resolve_glds_to_osd([accession]).get(accession)
+            if osd_accession is None:
+                raise ValueError(f"Could not find OSD mapping for {accession} in search results")
+            log.info(f"Found mapping: {accession} → {osd_accession}")
+
+            # Now get the files for this OSD
+            osd_num = osd_accession.split("-")[1]
+            file_url = GENELAB_DATASET_FILES.format(accession_number=osd_num)
+            log.info(f"Fetching files from: {file_url}")
+
+            with urlopen(file_url, timeout=REQUEST_TIMEOUT[1]) as file_response:
+                file_data = yaml.load(file_response.read(), Loader=YAML_LOADER)
+                try:
+                    df = pd.DataFrame(file_data['studies'][osd_accession]['study_files'])
+                    return df
+                except KeyError:
+                    raise ValueError(f"{osd_accession} is not reachable on OSD website after mapping from {accession}")
+
         except Exception as e:
             raise ValueError(f"Error retrieving files for {accession}: {str(e)}")
     else:
         raise ValueError(f"Invalid accession format: {accession}. Must start with 'OSD-' or 'GLDS-'.")
 
+@functools.cache
+def _compile_glob(filename_pattern: str) -> re.Pattern:
+    """Convert a glob pattern to a compiled regex pattern, cached as the same patterns are queried across accessions.
+
+    :param filename_pattern: Glob pattern, e.g. '*-ISA.zip'
+    :type filename_pattern: str
+    :return: Compiled regex pattern equivalent to the glob pattern
+    :rtype: re.Pattern
+    """
+    return re.compile(fnmatch.translate(filename_pattern))
+
 def find_matching_filenames(accession: str, filename_pattern: str) -> list[str]:
     """Returns list of file names that match the provided pattern.
 
@@ -107,14 +159,11 @@ def find_matching_filenames(accession: str, filename_pattern: str) -> list[str]:
     :return: List of file names that match the pattern
     :rtype: list[str]
     """
-    import re
-    import fnmatch
-    
-    # Convert glob pattern to regex pattern
-    regex_pattern = fnmatch.translate(filename_pattern)
-    
+    regex_pattern = _compile_glob(filename_pattern)
+
     df = get_table_of_files(accession)
-    return df.loc[df['file_name'].str.contains(regex_pattern, regex=True), 'file_name'].to_list()
+    # na=False keeps rows without a file name out of the match instead of failing the boolean selection
+    return df.loc[df['file_name'].str.contains(regex_pattern, na=False), 'file_name'].to_list()
 
 def retrieve_file_url(accession: str, filename: str) -> str:
     """Retrieve file URL associated with a GLDS accesion ID
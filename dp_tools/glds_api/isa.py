@@ -1,6 +1,6 @@
 import argparse
 from pathlib import Path
-from dp_tools.glds_api.commons import retrieve_file_url, find_matching_filenames, get_table_of_files
+from dp_tools.glds_api.commons import retrieve_file_url, find_matching_filenames, get_table_of_files, REQUEST_TIMEOUT
 
 import requests
 from loguru import logger as log
@@ -63,7 +63,7 @@ def download_isa(accession: str) -> Union[str, None]:
     # Construct and execute the download URL
     download_url = f"https://osdr.nasa.gov{file_row['remote_url']}"
     log.info(f"Download URL: {download_url}")
-    response = requests.get(download_url)
+    response = requests.get(download_url, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
         with open(file_to_download, 'wb') as f:
@@ -6,15 +6,21 @@ from pathlib import Path
 
 from loguru import logger as log
 
+def _add_to_sys_path(path: str):
+    # imports are cached in sys.modules, but repeated loads would otherwise keep growing sys.path
+    # which slows every later import that misses the cache
+    if path not in sys.path:
+        sys.path.append(path)
+
 def load_all_plugins(plugin_dir: Path):
-    sys.path.append(str(plugin_dir))
+    _add_to_sys_path(str(plugin_dir))
 
     print ("DP TOOLS VALIDATION PLUGIN LOADER starting.  loading plugins:")
     plugins = {}
     for plugin_file in sorted(os.listdir(plugin_dir)):
         print(f"- {plugin_file}")
         if re.search('^dp_tools__', plugin_file):
-            sys.path.append(plugin_file)
+            _add_to_sys_path(plugin_file)
             module_name = plugin_file
             module = importlib.import_module(module_name)
             module_key = re.sub('^dp_tools__', '', module_name)
@@ -24,7 +30,7 @@ def load_all_plugins(plugin_dir: Path):
 
 def load_plugin(plugin_dir: Path):
     plugin_str = plugin_dir.name
-    sys.path.append(str(plugin_dir.parent))
+    _add_to_sys_path(str(plugin_dir.parent))
 
     log.info(f"DP TOOLS VALIDATION PLUGIN LOADER starting.  loading plugins from '{plugin_dir}'")
     if re.search('^dp_tools__', plugin_str):
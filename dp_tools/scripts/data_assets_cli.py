@@ -1,3 +1,6 @@
+from collections import defaultdict
+import functools
+import os
 from pathlib import Path
 import re
 import itertools
@@ -5,6 +8,7 @@ import itertools
 import click
 from loguru import logger
 import yaml
+from dp_tools.config.interface import YAML_LOADER
 
 from dp_tools.glds_api import commons, isa
 from dp_tools.core.files import isa_archive
@@ -19,31 +23,104 @@ def product_dict(**kwargs):
     for instance in itertools.product(*vals):
         yield dict(zip(keys, instance))
 
+def list_files(root_dir: Path, relative_to: Path = None) -> list[Path]:
+    """Recursively list files under root_dir as paths relative to root_dir.
+
+    Uses os.scandir so file/directory checks reuse the cached directory entry
+    instead of issuing a stat per path as Path.rglob + Path.is_file does.
+    Like Path.rglob, symlinked directories are not descended into.
+    """
+    relative_to = root_dir if relative_to is None else relative_to
+    files: list[Path] = list()
+    with os.scandir(root_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                files.extend(list_files(Path(entry.path), relative_to))
+            elif entry.is_file():
+                files.append(Path(entry.path).relative_to(relative_to))
+    return files
+
+@functools.cache
+def expand_template(template_str: str, template_config: tuple[tuple[str, tuple], ...]) -> tuple[str, ...]:
+    """Fill in a template string with every combination of template values.
+
+    Cached as the same data asset templates are expanded again for every file checked,
+    hence the template config is supplied as hashable (key, values) pairs.
+    """
+    possible_filenames = tuple(template_str.format(**template_value_combo) for template_value_combo in product_dict(**dict(template_config)))
+    logger.trace("{}", possible_filenames)
+    return possible_filenames
+
+@functools.cache
+def index_possible_filenames(possible_filenames: tuple[str, ...]) -> tuple[dict[int, frozenset], dict[int, frozenset], tuple[str, ...]]:
+    """Index possible filenames for matching many relative query paths.
+
+    Returns path parts grouped by part count for directory (prefix) and exact (suffix) lookups,
+    as well as any patterns with wildcards, absolute roots or no parts which still require Path.match.
+    """
+    directory_parts: dict[int, set] = defaultdict(set)
+    exact_parts: dict[int, set] = defaultdict(set)
+    glob_patterns: list[str] = list()
+    for possible_filename in possible_filenames:
+        possible_path = Path(possible_filename)
+        directory_parts[len(possible_path.parts)].add(possible_path.parts)
+        # empty templates (e.g. '' or '.') are left to Path.match, which rejects them with 'empty pattern'
+        if not possible_path.parts or possible_path.is_absolute() or re.search(r"[*?\[]", possible_filename):
+            glob_patterns.append(possible_filename)
+        else:
+            exact_parts[len(possible_path.parts)].add(possible_path.parts)
+    return (
+        {n: frozenset(parts) for n, parts in directory_parts.items()},
+        {n: frozenset(parts) for n, parts in exact_parts.items()},
+        tuple(glob_patterns),
+    )
+
 def matches_template(query_path: Path, template_paths: list[str], template_config: dict, is_directory: bool):
-    logger.trace(query_path)
-    logger.trace(template_paths)
-    logger.trace(template_config)
-    logger.trace(is_directory)
+    # called for every file and data asset pair; brace style arguments defer formatting until a trace sink is enabled
+    logger.trace("{}", query_path)
+    logger.trace("{}", template_paths)
+    logger.trace("{}", template_config)
+    logger.trace("{}", is_directory)
 
     template_str = str(Path(template_paths[0]).joinpath(*[Path(p) for p in template_paths[1:]]))
 
-    logger.trace(f"template_str: {template_str}")
+    logger.trace("template_str: {}", template_str)
 
 
     # See if any template exist
     if not re.search('{.*}', template_str):
         logger.trace("No template sections, using exact filename")
-        possible_filenames = [template_str]
+        possible_filenames = (template_str,)
     else:
         # Create possible filenames by filling in template
-        possible_filenames = [template_str.format(**template_value_combo) for template_value_combo in product_dict(**template_config)]
-        logger.trace(possible_filenames )
-
-    for possible_filename in possible_filenames:
-        # Guard clause: Directory style assets
-        if query_path.is_relative_to(Path(possible_filename)) and is_directory:
+        possible_filenames = expand_template(
+            template_str,
+            tuple((key, tuple(values)) for key, values in template_config.items()),
+        )
+
+    if query_path.is_absolute():
+        for possible_filename in possible_filenames:
+            # Guard clause: Directory style assets
+            if query_path.is_relative_to(Path(possible_filename)) and is_directory:
+                return True
+
+            if query_path.match(possible_filename):
+                return True
+        return False
+
+    directory_parts, exact_parts_by_length, glob_patterns = index_possible_filenames(possible_filenames)
+    query_parts = query_path.parts
+
+    # Guard clause: Directory style assets
+    if is_directory and any(query_parts[:n] in directory_parts.get(n, ()) for n in range(len(query_parts) + 1)):
+        return True
+
+    # equivalent to Path.match for patterns without wildcards: the trailing parts must be equal
+    for n, exact_parts in exact_parts_by_length.items():
+        if n <= len(query_parts) and query_parts[len(query_parts) - n:] in exact_parts:
             return True
 
+    for possible_filename in glob_patterns:
         if query_path.match(possible_filename):
             return True
 
@@ -54,7 +131,7 @@ def matches_template(query_path: Path, template_paths: list[str], template_confi
 def load_config(yaml_file: str):
     logger.info(f"Found existing yaml file: loading {yaml_file}")
     with open(yaml_file, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
     return config
 
 @click.command()
@@ -84,7 +161,7 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
     logger.info(f"Reading files from {path_root_dir}")
 
     # Get all file paths as relative to path_root_dir
-    path_file_all = [f.relative_to(path_root_dir) for f in path_root_dir.rglob("*") if f.is_file()] # list to evaluate generator
+    path_file_all = list_files(path_root_dir)
 
     # Apply any requested filters
     path_file_filtered: list[Path] = path_file_all.copy()
@@ -96,14 +173,14 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
         for f in path_file_filtered:
             if f.match(pattern):
                 pattern_hit_counter[pattern] = pattern_hit_counter[pattern] + 1
-                logger.trace(f"Filtered out {f} due to matching excluded pattern: {pattern}")
+                logger.trace("Filtered out {} due to matching excluded pattern: {}", f, pattern)
                 to_remove.add(f)
                 continue
     
     # Note: we remove after checking all files.
     #   Removal from list during iteration causes an iteration bug
-    for f in to_remove:
-        path_file_filtered.remove(f)
+    #   A single pass with set membership avoids a linear list.remove per excluded file
+    path_file_filtered = [f for f in path_file_filtered if f not in to_remove]
 
 
     # Logging re: filtering results
@@ -135,13 +212,13 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
     while path_file_unassigned:
         for i, path_file in enumerate(path_file_unassigned):
             path_has_match = False
-            logger.debug(f"Checking if {path_file} matches existing keys. File Number {i+1} of {len(path_file_unassigned)}")
+            logger.debug("Checking if {} matches existing keys. File Number {} of {}", path_file, i + 1, len(path_file_unassigned))
             for key, meta_asset in data_assets.items():
-                logger.trace(meta_asset)
+                logger.trace("{}", meta_asset)
                 if matches_template(path_file, meta_asset['local location'], template_values, meta_asset.get("is directory")):
                     path_file_unassigned.remove(path_file)
                     path_has_match = True
-                    continue
+                    break # A file is assigned once, even if it matches more than one data asset
 
             if path_has_match:
                 continue
@@ -43,7 +43,7 @@ def download_files(osd_id, file_pattern, dry_run, non_interactive):
             url = commons.retrieve_file_url(accession = osd_id, filename = filename)
             logger.info(f"Downloading file: {filename}. {i+1} of {len(filenames)}")
             logger.debug(f"Download url: {url}")
-            r = requests.get(url)  
+            r = requests.get(url, timeout=commons.REQUEST_TIMEOUT)
             with open(filename, 'wb') as f:
                 f.write(r.content)
 @click.command()
@@ -82,7 +82,7 @@ def get_samples(osd_id, output):
             target_file = isa_sample_and_assay_files[selection]
             logger.info(f"Selected {target_file}")
     
-    samples = [s.strip() for s in pd.read_csv(target_file, sep="\t")["Sample Name"]]
+    samples = [s.strip() for s in pd.read_csv(target_file, sep="\t", usecols=["Sample Name"])["Sample Name"]]
 
     logger.info(f"Found {len(samples)} samples. Outputting to {output}.")
     with open(output, "w") as f:
@@ -100,7 +100,7 @@ def run(
     df = report["flag_table"]
 
     # PREPEND MANUAL_CHECKS_PENDING to log file if appropriate
-    count_manual_checks = len(df.loc[df["code"] == FlagCode.MANUAL])
+    count_manual_checks = int((df["code_level"] == FlagCode.MANUAL.value).sum())
     if count_manual_checks != 0:
         output = f"{output}.MANUAL_CHECKS_PENDING"
         click.echo(f"Found {count_manual_checks} Manual checks pending!")
@@ -109,11 +109,11 @@ def run(
     click.echo(f"Writing results to '{output}'")
 
     # Raise error if any flag code exceeds max_flag_code
-    flagged_messages = "\n".join(
-        [msg for msg in df.loc[df["code_level"] >= max_flag_code]["message"]]
-    )
+    # a single comparison pass serves both the halt decision and the reported messages
+    exceeded_mask = df["code_level"] >= max_flag_code
+    flagged_messages = "\n".join(df.loc[exceeded_mask, "message"])
     assert (
-        df["code_level"].max() < max_flag_code
+        not exceeded_mask.any()
     ), f"Maximum flag code exceeded: {max_flag_code}. Printing flag messages that caused this halt: {flagged_messages}"
 
 
@@ -126,10 +126,8 @@ def manual_checks(validation_report):
     click.echo("Reading in report: 'validation_report'")
     df = pd.read_csv(validation_report, sep="\t")
 
-    manual_checks_count = 0
-    for _, row in df.iterrows():
-        if int(row["code_level"]) == FlagCode.MANUAL.value:
-            manual_checks_count += 1
+    manual_mask = df["code_level"].astype(int) == FlagCode.MANUAL.value
+    manual_checks_count = int(manual_mask.sum())
 
     click.echo(
         f"Found {manual_checks_count} manual checks pending... Starting manual review"
@@ -139,26 +137,24 @@ def manual_checks(validation_report):
     while not analyst_id:
         analyst_id = input("Enter analyst ID (This will be saved in completed log): ")
 
-    new_rows = list()
-    for _, row in df.iterrows():
-        logger.debug(f"Processsing: {row}")
-        # Pass through if not manual
-        if int(row["code_level"]) != FlagCode.MANUAL.value:
-            new_rows.append(dict(row))
-        else:
-            # Manual check
-            logger.debug(
-                f"""Loading as json string: {row['kwargs'].replace("'",'"')}"""
-            )
-            result = run_manual_check(**json.loads(row["kwargs"].replace("'", '"')))
-            # replace original manual check notice with filled results
-            row = dict(row) | result
-            row["kwargs"] = str(
-                json.loads(row["kwargs"].replace("'", '"')) | {"analyst_ID": analyst_id}
-            )
-            new_rows.append(row)
-
-    new_df = pd.DataFrame(new_rows)
+    def complete_manual_check(kwargs: str) -> dict:
+        logger.debug(f"""Loading as json string: {kwargs.replace("'",'"')}""")
+        parsed_kwargs = json.loads(kwargs.replace("'", '"'))
+        result = run_manual_check(**parsed_kwargs)
+        # replace original manual check notice with filled results
+        return result | {
+            "code": str(result["code"]),
+            "kwargs": str(parsed_kwargs | {"analyst_ID": analyst_id}),
+        }
+
+    # Only manual rows are touched, all other rows pass through with their original dtypes
+    new_df = df.copy()
+    if manual_checks_count:
+        results = pd.DataFrame(
+            [complete_manual_check(kwargs) for kwargs in df.loc[manual_mask, "kwargs"]],
+            index=df.index[manual_mask],
+        )
+        new_df.loc[manual_mask, results.columns] = results
 
     click.echo("Completed manual checks")
 
@@ -1,6 +1,14 @@
+import gzip
 import os
 from pathlib import Path
+import random
 import re
+import shutil
+import zlib
+
+import pytest
+
+from dp_tools.bulkRNASeq import checks as checks_module
 from dp_tools.bulkRNASeq.checks import *
 from dp_tools.core.check_model import FlagCode
 
@@ -66,6 +74,205 @@ def test_check_gzip_file_integrity(glds48_dataSystem):
         assert res["message"]
 
 
+FASTQ_RECORDS = b"@read1\nACGT\n+\nIIII\n" * 10
+
+
+@pytest.fixture
+def fastq_gz_files(tmp_path):
+    """A valid fastqGZ file and a copy truncated inside the gzip trailer, both with FASTQ_RECORDS"""
+    content = gzip.compress(FASTQ_RECORDS)
+    good = tmp_path / "good.fastq.gz"
+    good.write_bytes(content)
+    truncated = tmp_path / "truncated.fastq.gz"
+    truncated.write_bytes(content[:-10])
+    return good, truncated
+
+
+def test_check_fastqgz_file_contents(tmp_path, fastq_gz_files):
+    good, truncated = fastq_gz_files
+    bad_header = tmp_path / "bad_header.fastq.gz"
+    bad_header.write_bytes(gzip.compress(FASTQ_RECORDS + b"read11\nACGT\n+\nIIII\n"))
+
+    res = check_fastqgz_file_contents(file=good, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.GREEN
+
+    res = check_fastqgz_file_contents(file=bad_header, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.HALT
+    assert "[41]" in res["message"]
+
+    res = check_fastqgz_file_contents(file=truncated, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.HALT
+
+
+def test_check_fastqgz_file_contents_chunk_boundaries(tmp_path):
+    # a single line longer than the 1 MiB read size must not end the scan early
+    long_record = b"@read1\n" + b"A" * (3 * 1024 * 1024) + b"\n+\n" + b"I" * 4 + b"\n"
+    long_line = tmp_path / "long_line.fastq.gz"
+    long_line.write_bytes(gzip.compress(long_record + b"read2\nACGT\n+\nIIII\n"))
+
+    res = check_fastqgz_file_contents(file=long_line, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.HALT
+    assert "[5]" in res["message"]
+
+    long_line_truncated = tmp_path / "long_line_truncated.fastq.gz"
+    long_line_truncated.write_bytes(gzip.compress(long_record * 2)[:-10])
+
+    res = check_fastqgz_file_contents(file=long_line_truncated, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.HALT
+
+    # a long newline free run is scanned in linear time, only the first byte of an unfinished line is kept
+    # (re-copying the pending line on every 1 MiB read takes seconds here rather than a fraction of one)
+    newline_free = tmp_path / "newline_free.fastq.gz"
+    newline_free.write_bytes(gzip.compress(b"@" + bytes(128 * 1024 * 1024), compresslevel=1))
+
+    res = check_fastqgz_file_contents(file=newline_free, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.GREEN
+
+    newline_free.write_bytes(gzip.compress(b"read1" + bytes(128 * 1024 * 1024) + b"\nACGT\n+\nIIII\n", compresslevel=1))
+
+    res = check_fastqgz_file_contents(file=newline_free, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.HALT
+    assert "[1]" in res["message"]
+
+    # line limit falls inside the first chunk, line N stops the check so N-1 lines are checked
+    bad_header = tmp_path / "bad_header.fastq.gz"
+    bad_header.write_bytes(gzip.compress(FASTQ_RECORDS + b"read11\nACGT\n+\nIIII\n"))
+
+    res = check_fastqgz_file_contents(file=bad_header, count_lines_to_check=41)
+    assert res["code"] == FlagCode.GREEN
+
+    res = check_fastqgz_file_contents(file=bad_header, count_lines_to_check=42)
+    assert res["code"] == FlagCode.HALT
+    assert "[41]" in res["message"]
+
+
+@pytest.mark.parametrize(
+    "reader,reader_error",
+    [
+        (checks_module.gzip_reader, checks_module.gzip_reader_error),
+        (gzip, zlib.error),
+    ],
+    ids=["installed_reader", "stdlib_gzip"],
+)
+def test_check_gzip_file_integrity_in_process(
+    tmp_path, monkeypatch, fastq_gz_files, reader, reader_error
+):
+    monkeypatch.setattr(checks_module, "gzip_reader", reader)
+    monkeypatch.setattr(checks_module, "gzip_reader_error", reader_error)
+    good, truncated = fastq_gz_files
+    content = good.read_bytes()
+    bad_crc = tmp_path / "bad_crc.fastq.gz"
+    bad_crc.write_bytes(content[:-8] + bytes(4) + content[-4:])
+    # truncated to zero bytes, 'gzip -t' fails this as there is no gzip member at all
+    empty = tmp_path / "empty.fastq.gz"
+    empty.write_bytes(b"")
+    # zeroed bytes inside the deflate body, raised as IsalError rather than zlib.error when ISA-L is used
+    rng = random.Random(0)
+    records = b"".join(
+        b"@read%d\n%s\n+\n%s\n"
+        % (i, bytes(rng.choice(b"ACGT") for _ in range(50)), b"I" * 50)
+        for i in range(200)
+    )
+    corrupt_deflate_content = bytearray(gzip.compress(records))
+    middle = len(corrupt_deflate_content) // 2
+    corrupt_deflate_content[middle : middle + 30] = bytes(30)
+    corrupt_deflate = tmp_path / "corrupt_deflate.fastq.gz"
+    corrupt_deflate.write_bytes(bytes(corrupt_deflate_content))
+
+    res = check_gzip_file_integrity(file=good)
+    assert res["code"] == FlagCode.GREEN
+
+    # a valid gzip member with no content is not an empty file
+    empty_member = tmp_path / "empty_member.fastq.gz"
+    empty_member.write_bytes(gzip.compress(b""))
+    res = check_gzip_file_integrity(file=empty_member)
+    assert res["code"] == FlagCode.GREEN
+
+    for bad in (truncated, bad_crc, corrupt_deflate, empty):
+        res = check_gzip_file_integrity(file=bad)
+        assert res["code"] == FlagCode.HALT
+        assert res["message"]
+
+    res = check_fastqgz_file_contents(file=corrupt_deflate, count_lines_to_check=-1)
+    assert res["code"] == FlagCode.HALT
+
+
+def test_check_gzip_file_integrity_skips_verified_streams(tmp_path, monkeypatch, fastq_gz_files):
+    fastq, _ = fastq_gz_files
+    content = fastq.read_bytes()
+    opened: list[Path] = list()
+
+    class RecordingReader:
+        @staticmethod
+        def open(file, mode):
+            opened.append(Path(file))
+            return gzip.open(file, mode)
+
+    monkeypatch.setattr(checks_module, "gzip_reader", RecordingReader)
+
+    # read to the end of the stream, so the integrity check need not decompress again
+    assert check_fastqgz_file_contents(file=fastq, count_lines_to_check=-1)["code"] == FlagCode.GREEN
+    opened.clear()
+    assert check_gzip_file_integrity(file=fastq)["code"] == FlagCode.GREEN
+    assert opened == []
+
+    # a modified file is decompressed again
+    fastq.write_bytes(content[:-10])
+    res = check_gzip_file_integrity(file=fastq)
+    assert opened == [fastq]
+    assert res["code"] == FlagCode.HALT
+
+    # a file replaced while being read is not recorded as verified, the new contents were never checked
+    class ReplacingReader:
+        @staticmethod
+        def open(file, mode):
+            handle = gzip.open(file, mode)
+            replacement = tmp_path / "replacement.fastq.gz"
+            replacement.write_bytes(content[:-10])
+            os.replace(replacement, file)
+            return handle
+
+    replaced = tmp_path / "replaced.fastq.gz"
+    replaced.write_bytes(content)
+    monkeypatch.setattr(checks_module, "gzip_reader", ReplacingReader)
+    assert check_fastqgz_file_contents(file=replaced, count_lines_to_check=-1)["code"] == FlagCode.GREEN
+    monkeypatch.setattr(checks_module, "gzip_reader", RecordingReader)
+    opened.clear()
+    res = check_gzip_file_integrity(file=replaced)
+    assert opened == [replaced]
+    assert res["code"] == FlagCode.HALT
+
+    # the record of verified streams is bounded, oldest entries are dropped first
+    monkeypatch.setattr(checks_module, "_GZIP_STREAMS_VERIFIED", dict())
+    monkeypatch.setattr(checks_module, "_GZIP_STREAMS_VERIFIED_LIMIT", 1)
+    fastq.write_bytes(content)
+    second = tmp_path / "second.fastq.gz"
+    second.write_bytes(content)
+    for file in (fastq, second):
+        check_fastqgz_file_contents(file=file, count_lines_to_check=-1)
+    assert list(checks_module._GZIP_STREAMS_VERIFIED) == [checks_module._gzip_stream_key(second)]
+
+
+def test_check_gzip_file_integrity_gzip_bin(tmp_path, fastq_gz_files):
+    gzip_bin = shutil.which("gzip")
+    if gzip_bin is None:
+        pytest.skip("gzip binary not available")
+    good, truncated = fastq_gz_files
+
+    res = check_gzip_file_integrity(file=good, gzip_bin=gzip_bin)
+    assert res["code"] == FlagCode.GREEN
+
+    # failures are only reported on stderr with a nonzero exit status
+    res = check_gzip_file_integrity(file=truncated, gzip_bin=gzip_bin)
+    assert res["code"] == FlagCode.HALT
+    assert "truncated.fastq.gz" in res["message"]
+
+    empty = tmp_path / "empty.fastq.gz"
+    empty.write_bytes(b"")
+    assert check_gzip_file_integrity(file=empty, gzip_bin=gzip_bin)["code"] == FlagCode.HALT
+    assert check_gzip_file_integrity(file=empty)["code"] == FlagCode.HALT
+
+
 def test_check_ERCC_group_represention(glds194_dataSystem):
     dataset = glds194_dataSystem.dataset
 
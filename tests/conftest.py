@@ -5,7 +5,7 @@ import pytest
 from dp_tools.core.loaders import load_data
 
 # set for testing
-@pytest.fixture
+@pytest.fixture(scope="session")
 def root_test_dir():
     """This should be development machine specific, path should be set by env variable for privacy"""
     return Path(os.environ["TEST_ASSETS_DIR"])
@@ -90,7 +90,7 @@ def glds48_sample_names():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def glds194_test_dir(root_test_dir):
     return root_test_dir / "GLDS-194"
 
@@ -100,7 +100,7 @@ def glds194_runsheetPath(glds194_test_dir):
     return glds194_test_dir / "Metadata" / "GLDS-194_bulkRNASeq_v1_runsheet.csv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def glds48_test_dir(root_test_dir):
     return root_test_dir / "GLDS-48"
 
@@ -114,7 +114,8 @@ def typo_test_dir(root_test_dir):
     return root_test_dir / "GLDS-48_BUTWITHTYPOS"
 
 
-@pytest.fixture
+# loaded data systems are only read by tests, so each is loaded once per test session
+@pytest.fixture(scope="session")
 def glds48_dataSystem(glds48_test_dir):
     return load_data(
         key_sets=["is single end full", "glds metadata"],
@@ -124,7 +125,7 @@ def glds48_dataSystem(glds48_test_dir):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def glds194_dataSystem(glds194_test_dir):
     return load_data(
         key_sets=["is paired end full", "ERCC DGE Output", "glds metadata"],
@@ -136,7 +137,7 @@ def glds194_dataSystem(glds194_test_dir):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def glds251_dataSystem(root_test_dir):
     glds251_test_dir = root_test_dir / "GLDS-251"
     return load_data(
@@ -5,14 +5,15 @@ import re
 
 from dp_tools.glds_api.commons import (
     get_table_of_files,
+    _get_search_identifier_index,
     retrieve_file_url,
     find_matching_filenames
 )
 
 
 @patch('dp_tools.glds_api.commons.urlopen')
-@patch('dp_tools.glds_api.commons.yaml.safe_load')
-@patch('dp_tools.glds_api.commons.json.loads')
+@patch('dp_tools.glds_api.commons.yaml.load')
+@patch('dp_tools.glds_api.commons.json_tools.loads')
 def test_get_table_of_files(mock_json_loads, mock_yaml_load, mock_urlopen):
     # Mock for GLDS-194
     mock_data_194 = {
@@ -63,6 +64,7 @@ def test_get_table_of_files(mock_json_loads, mock_yaml_load, mock_urlopen):
     
     # Clear cache to ensure clean test
     get_table_of_files.cache_clear()
+    _get_search_identifier_index.cache_clear()
     
     # Test GLDS-194
     accession = "GLDS-194"
@@ -74,6 +76,9 @@ def test_get_table_of_files(mock_json_loads, mock_yaml_load, mock_urlopen):
     df = get_table_of_files(accession)
     assert len(df) == 73
 
+    # Both GLDS accessions are mapped from a single search API response
+    assert mock_json_loads.call_count == 1
+
 @patch('dp_tools.glds_api.commons.get_table_of_files')
 def test_retrieve_file_url(mock_get_table):
     # Mock data for GLDS-194
@@ -2,6 +2,45 @@
 
 
 import os
+from pathlib import Path
+
+import pytest
+
+from dp_tools.scripts.data_assets_cli import matches_template
+
+
+@pytest.mark.parametrize(
+    "query_path,template_paths,template_config,is_directory,expected",
+    [
+        # exact template matches as a path suffix, not a substring
+        ("Metadata/GLDS-194_runsheet.csv", ["Metadata", "GLDS-194_runsheet.csv"], {}, False, True),
+        ("a/Metadata/GLDS-194_runsheet.csv", ["Metadata", "GLDS-194_runsheet.csv"], {}, False, True),
+        ("Metadata/xGLDS-194_runsheet.csv", ["Metadata", "GLDS-194_runsheet.csv"], {}, False, False),
+        ("GLDS-194_runsheet.csv", ["Metadata", "GLDS-194_runsheet.csv"], {}, False, False),
+        # template values are expanded
+        ("00-RawData/S2_R1.fastq.gz", ["00-RawData", "{sample}_R{read}.fastq.gz"], {"sample": ["S1", "S2"], "read": ["1", "2"]}, False, True),
+        ("00-RawData/S3_R1.fastq.gz", ["00-RawData", "{sample}_R{read}.fastq.gz"], {"sample": ["S1", "S2"], "read": ["1", "2"]}, False, False),
+        # directory assets match any path under the directory prefix
+        ("02-Alignment/S1/S1.bam", ["02-Alignment", "{sample}"], {"sample": ["S1"]}, True, True),
+        ("02-Alignment/S1/S1.bam", ["02-Alignment", "{sample}"], {"sample": ["S1"]}, False, False),
+        ("03-Other/02-Alignment/S1/S1.bam", ["02-Alignment", "{sample}"], {"sample": ["S1"]}, True, False),
+        # wildcards
+        ("Metadata/GLDS-194-ISA.zip", ["Metadata", "*-ISA.zip"], {}, False, True),
+        ("Metadata/GLDS-194-ISA.tar", ["Metadata", "*-ISA.zip"], {}, False, False),
+        # absolute templates only match from the root
+        ("/data/Metadata/runsheet.csv", ["/data/Metadata", "runsheet.csv"], {}, False, True),
+        ("Metadata/runsheet.csv", ["/data/Metadata", "runsheet.csv"], {}, False, False),
+        ("/data/Metadata/runsheet.csv", ["Metadata", "runsheet.csv"], {}, False, True),
+    ],
+)
+def test_matches_template(query_path, template_paths, template_config, is_directory, expected):
+    assert matches_template(Path(query_path), template_paths, template_config, is_directory) == expected
+
+
+@pytest.mark.parametrize("template", ["", "."])
+def test_matches_template_rejects_empty_template(template):
+    with pytest.raises(ValueError):
+        matches_template(Path("Metadata/runsheet.csv"), [template], {}, False)
 
 
 def test_dp_tools_isa_get(script_runner, tmpdir):